@@ -0,0 +1,283 @@
+"""
+Color palette extraction from wallpaper images.
+Needs Pillow and NumPy (plus scikit-learn for the kmeans method), so it
+runs inside the palette venv set up by generate_palette.py.
+"""
+
+from PIL import Image
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the kernels below simply run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# WCAG relative luminance constants
+_SRGB_THR = 0.03928
+_COEF = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+# sRGB -> linear lookup table for every 8-bit channel value
+_SRGB = np.arange(256) / 255.0
+_LIN_LUT = np.where(_SRGB <= _SRGB_THR, _SRGB / 12.92, ((_SRGB + 0.055) / 1.055) ** 2.4).astype(np.float32)
+
+def luminance_batch(rgb_u8):
+    """Calculate relative luminance for an (N, 3) array of RGB colors."""
+    return _LIN_LUT[np.asarray(rgb_u8, dtype=np.uint8).reshape(-1, 3)] @ _COEF
+
+def rgb_to_hex(rgb):
+    """Convert RGB tuple to hex string."""
+    return "#{:02x}{:02x}{:02x}".format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+
+def hex_to_rgb(hex_color):
+    """Convert hex string to RGB tuple."""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+def get_luminance(rgb):
+    """Calculate relative luminance of RGB color."""
+    r, g, b = rgb
+    return float(_LIN_LUT[r] * 0.2126 + _LIN_LUT[g] * 0.7152 + _LIN_LUT[b] * 0.0722)
+
+def get_contrast_ratio(rgb1, rgb2):
+    """Calculate WCAG contrast ratio between two colors."""
+    lum1 = get_luminance(rgb1)
+    lum2 = get_luminance(rgb2)
+    lighter = max(lum1, lum2)
+    darker = min(lum1, lum2)
+    return (lighter + 0.05) / (darker + 0.05)
+
+def adjust_color_for_contrast(color, background, target_ratio=7.0, lighten=True):
+    """Adjust a color to meet minimum contrast ratio with background."""
+    current_ratio = get_contrast_ratio(color, background)
+    if current_ratio >= target_ratio:
+        return color
+    
+    # Solve for the luminance that hits the target ratio directly
+    bg_lum = float(luminance_batch([background])[0])
+    if lighten:
+        target_lum = min(1.0, target_ratio * (bg_lum + 0.05) - 0.05)
+    else:
+        target_lum = max(0.0, (bg_lum + 0.05) / target_ratio - 0.05)
+    
+    # Scale the color in linear space to reach the target luminance
+    lin = _LIN_LUT[np.asarray(color, dtype=np.uint8)].astype(np.float64)
+    lum = float(lin @ _COEF)
+    if lum > 0:
+        lin = np.clip(lin * (target_lum / lum), 0.0, 1.0)
+    else:
+        lin = np.full(3, target_lum)
+    
+    # Saturated channels lose luminance when clipped; blend toward white
+    lum = float(lin @ _COEF)
+    if lighten and lum < target_lum:
+        lin = lin + (1.0 - lin) * ((target_lum - lum) / (1.0 - lum))
+    
+    # Back to sRGB, rounding away from the background
+    srgb = np.where(lin <= _SRGB_THR / 12.92, lin * 12.92, 1.055 * lin ** (1 / 2.4) - 0.055)
+    srgb = np.ceil(srgb * 255) if lighten else np.floor(srgb * 255)
+    return tuple(int(v) for v in np.clip(srgb, 0, 255))
+
+@njit(cache=True)
+def _greedy_filter(palette, threshold_sq, max_colors):
+    """Return indices of colors not within threshold of an earlier kept color."""
+    kept = np.empty(palette.shape[0], dtype=np.int32)
+    count = 0
+    for i in range(palette.shape[0]):
+        similar = False
+        for k in range(count):
+            j = kept[k]
+            dr = palette[i, 0] - palette[j, 0]
+            dg = palette[i, 1] - palette[j, 1]
+            db = palette[i, 2] - palette[j, 2]
+            if dr * dr + dg * dg + db * db < threshold_sq:
+                similar = True
+                break
+        if not similar:
+            kept[count] = i
+            count += 1
+            if count >= max_colors:
+                break
+    return kept[:count]
+
+def filter_similar_colors(palette, max_colors, threshold=20):
+    """Greedily drop colors too close to an earlier (more dominant) one."""
+    palette_arr = np.ascontiguousarray(palette, dtype=np.int32).reshape(-1, 3)
+    return list(palette_arr[_greedy_filter(palette_arr, threshold * threshold, max_colors)])
+
+def histogram_palette(data, num_bins=64):
+    """Return the most populated 5-bit-per-channel color bins, most dominant first."""
+    q = (data >> 3).astype(np.int32)
+    idx = (q[:, 0] << 10) | (q[:, 1] << 5) | q[:, 2]
+    counts = np.bincount(idx, minlength=1 << 15)
+    
+    top = np.argpartition(counts, -num_bins)[-num_bins:]
+    top = top[np.argsort(counts[top])[::-1]]
+    top = top[counts[top] > 0]
+    
+    # Unpack bin indices back to RGB bin centers
+    return np.stack([(top >> 10) & 31, (top >> 5) & 31, top & 31], axis=1) * 8 + 4
+
+def mediancut_palette(image, num_colors):
+    """Return the colors of a median-cut quantized image, most dominant first."""
+    quantized = image.quantize(num_colors, method=Image.Quantize.MEDIANCUT)
+    pal = quantized.getpalette()
+    
+    palette = []
+    for count, i in sorted(quantized.getcolors(), reverse=True):
+        rgb = np.array(pal[i * 3:i * 3 + 3])
+        # Skip pure black and white entries (often artifacts)
+        if 10 <= rgb.sum() <= 745:
+            palette.append(rgb)
+    return palette
+
+def extract_palette(image_path, num_colors=16, method="histogram"):
+    """Extract color palette from image using a color histogram, median cut or K-means."""
+    try:
+        # Load and process image
+        image = Image.open(image_path)
+        
+        # Convert to RGB if necessary
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        # Cheap power-of-two box downsample first so Lanczos touches fewer pixels
+        factor = min(image.width // 600, image.height // 600)
+        if factor >= 2:
+            image = image.reduce(1 << (factor.bit_length() - 1))
+        
+        # Resize for faster processing
+        image.thumbnail((300, 300), Image.Resampling.LANCZOS)
+        
+        if method == "mediancut":
+            # Pillow's C median-cut quantizer works on the image directly
+            palette = mediancut_palette(image, num_colors * 2)
+        else:
+            # Convert to numpy array
+            data = np.asarray(image, dtype=np.uint8).reshape(-1, 3)
+        
+            # Remove pure black and white pixels (often artifacts)
+            channel_sum = data.sum(axis=1, dtype=np.int32)
+            mask = (channel_sum >= 10) & (channel_sum <= 745)
+            if mask.any():
+                data = data[mask]
+        
+            if method == "kmeans":
+                # scikit-learn is slow to import, so only load it when asked for
+                from sklearn.cluster import MiniBatchKMeans
+                
+                # Perform mini-batch K-means clustering
+                kmeans = MiniBatchKMeans(
+                    n_clusters=min(num_colors, len(data)),
+                    batch_size=4096,
+                    n_init=3,
+                    max_iter=100,
+                    reassignment_ratio=0.01,
+                    random_state=42,
+                )
+                kmeans.fit(data)
+            
+                # Get cluster centers (dominant colors)
+                colors = kmeans.cluster_centers_.astype(int)
+            
+                # Sort by cluster size (most dominant first)
+                labels = kmeans.labels_
+                color_counts = [(np.sum(labels == i), colors[i]) for i in range(len(colors))]
+                color_counts.sort(reverse=True, key=lambda x: x[0])
+            
+                # Extract just the colors
+                palette = [color for count, color in color_counts]
+            else:
+                # Dominant bins of a 32x32x32 color histogram
+                palette = list(histogram_palette(data))
+        
+        # Remove similar colors
+        return filter_similar_colors(palette, num_colors)
+        
+    except Exception as e:
+        print(f"Error extracting palette: {e}")
+        return None
+
+def ensure_readable_colors(colors, background):
+    """Ensure all colors have good contrast with background."""
+    min_contrast = 4.5
+    
+    # Compute every contrast ratio in one vectorized pass
+    keys = [key for key in colors if key.startswith('color') or key == 'foreground']
+    rgbs = np.array([hex_to_rgb(colors[key]) for key in keys], dtype=np.uint8)
+    bg_lum = float(luminance_batch([background])[0])
+    lums = luminance_batch(rgbs)
+    contrasts = (np.maximum(lums, bg_lum) + 0.05) / (np.minimum(lums, bg_lum) + 0.05)
+    lighten = bg_lum < 0.5  # Lighten if background is dark
+    
+    # Only rewrite the entries that fail; the rest keep their original strings
+    adjusted = colors.copy()
+    for i in np.flatnonzero(contrasts < min_contrast):
+        adjusted_rgb = adjust_color_for_contrast(rgbs[i].tolist(), background, min_contrast, lighten)
+        adjusted[keys[i]] = rgb_to_hex(adjusted_rgb)
+    
+    return adjusted
+
+def generate_terminal_colors(palette):
+    """Generate a complete terminal color scheme from the palette."""
+    if len(palette) < 2:
+        print("Error: Need at least 2 colors in palette")
+        return None
+    
+    # Sort colors by luminance
+    palette_with_lum = [(color, get_luminance(color)) for color in palette]
+    palette_with_lum.sort(key=lambda x: x[1])
+    
+    # Extract colors by luminance
+    darkest = palette_with_lum[0][0]
+    brightest = palette_with_lum[-1][0]
+    
+    # Find colors for different purposes
+    background = darkest
+    foreground = brightest
+    
+    # Helper to get color from palette or generate variant
+    def get_color(idx, default_rgb, brighten=0):
+        if idx < len(palette):
+            base = palette[idx]
+        else:
+            # Generate from existing colors
+            base = palette[idx % len(palette)]
+        
+        if brighten > 0:
+            return tuple(min(255, c + brighten) for c in base)
+        return base
+    
+    # Generate 16 colors for terminal
+    colors = {
+        # Standard colors (0-7)
+        'color0': rgb_to_hex(background),  # black
+        'color1': rgb_to_hex(get_color(1, (204, 102, 102))),  # red
+        'color2': rgb_to_hex(get_color(2, (153, 204, 102))),  # green
+        'color3': rgb_to_hex(get_color(3, (204, 204, 102))),  # yellow
+        'color4': rgb_to_hex(get_color(4, (102, 153, 204))),  # blue
+        'color5': rgb_to_hex(get_color(5, (204, 102, 204))),  # magenta
+        'color6': rgb_to_hex(get_color(6, (102, 204, 204))),  # cyan
+        'color7': rgb_to_hex(foreground),  # white
+        
+        # Bright colors (8-15) - brightened versions
+        'color8': rgb_to_hex(tuple(min(255, c + 50) for c in background)),  # bright black
+        'color9': rgb_to_hex(get_color(1, (255, 132, 132), brighten=30)),  # bright red
+        'color10': rgb_to_hex(get_color(2, (183, 255, 132), brighten=30)),  # bright green
+        'color11': rgb_to_hex(get_color(3, (255, 255, 132), brighten=30)),  # bright yellow
+        'color12': rgb_to_hex(get_color(4, (132, 183, 255), brighten=30)),  # bright blue
+        'color13': rgb_to_hex(get_color(5, (255, 132, 255), brighten=30)),  # bright magenta
+        'color14': rgb_to_hex(get_color(6, (132, 255, 255), brighten=30)),  # bright cyan
+        'color15': rgb_to_hex(tuple(min(255, c + 30) for c in foreground)),  # bright white
+        
+        # Special colors
+        'background': rgb_to_hex(background),
+        'foreground': rgb_to_hex(foreground),
+        'cursor': rgb_to_hex(foreground),
+        'cursor_text_color': rgb_to_hex(background),
+        'selection_background': rgb_to_hex(tuple(min(255, c + 40) for c in background)),
+        'selection_foreground': rgb_to_hex(foreground),
+    }
+    
+    return colors
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Warm-start daemon for the MP3 Transcription Tool.
+Keeps a loaded transcriber in memory and serves transcription requests over a
+Unix socket, so repeated CLI invocations skip the model load entirely.
+"""
+
+import os
+import secrets
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SOCKET_PATH = Path.home() / ".transcribe.sock"
+AUTHKEY_PATH = Path.home() / ".transcribe.key"
+
+
+def _read_authkey() -> Optional[bytes]:
+    """Read the shared secret written by the running daemon."""
+    try:
+        return AUTHKEY_PATH.read_bytes()
+    except OSError:
+        return None
+
+
+def _stop_when_idle(idle_timeout: float, activity: threading.Event, busy: threading.Lock,
+                    stopping: threading.Event):
+    """Watchdog thread: flag the daemon to stop once no job has arrived for idle_timeout seconds."""
+    while True:
+        if activity.wait(idle_timeout):
+            activity.clear()
+            continue
+        if busy.locked():
+            continue
+        print(f"Idle for {idle_timeout:.0f}s, shutting down")
+        stopping.set()
+        # The accept loop only sees the flag once a connection comes in; keep poking until it has
+        while request({'command': 'stop'}) is None and SOCKET_PATH.exists():
+            time.sleep(1)
+        return
+
+
+def serve(transcriber, settings: Dict[str, Any], idle_timeout: Optional[float] = None):
+    """
+    Serve transcription requests until a stop request arrives.
+
+    Args:
+        transcriber: Loaded transcriber exposing transcribe_file(path, include_timestamps)
+        settings: Model and other settings that shape the transcript; requests
+            asking for anything else are refused
+        idle_timeout: Seconds without requests after which the daemon exits and frees the model
+    """
+    model_name = settings['model']
+    authkey = secrets.token_bytes(32)
+    fd = os.open(AUTHKEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(authkey)
+
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()
+
+    listener = Listener(str(SOCKET_PATH), family='AF_UNIX', authkey=authkey)
+    os.chmod(SOCKET_PATH, 0o600)
+    print(f"Transcription daemon ready ({model_name}) on {SOCKET_PATH}")
+
+    activity = threading.Event()
+    busy = threading.Lock()
+    stopping = threading.Event()
+    if idle_timeout:
+        threading.Thread(target=_stop_when_idle, args=(idle_timeout, activity, busy, stopping),
+                         daemon=True).start()
+
+    try:
+        while not stopping.is_set():
+            try:
+                conn = listener.accept()
+            except AuthenticationError:
+                continue
+
+            with conn:
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    continue
+
+                # A job arriving as the idle timeout fires gets no results and runs locally instead
+                if message.get('command') == 'stop' or stopping.is_set():
+                    conn.send({'ok': True})
+                    break
+
+                if message.get('settings') != settings:
+                    conn.send({'error': f"daemon is running with {settings}"})
+                    continue
+
+                with busy:
+                    activity.set()
+                    results = []
+                    for file_path in message['files']:
+                        try:
+                            result = transcriber.transcribe_file(Path(file_path), message['timestamps'])
+                            results.append({
+                                'file': file_path,
+                                'text': result.text,
+                                'segments': result.segments,
+                                'language': result.language,
+                            })
+                        except Exception as e:
+                            results.append({'file': file_path, 'error': str(e)})
+                    activity.set()
+
+                conn.send({'results': results})
+    finally:
+        listener.close()
+        for path in (SOCKET_PATH, AUTHKEY_PATH):
+            if path.exists():
+                path.unlink()
+
+
+def request(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Send a request to the running daemon.
+
+    Args:
+        message: Request dictionary
+
+    Returns:
+        The daemon's reply, or None if no daemon is reachable
+    """
+    authkey = _read_authkey()
+    if authkey is None or not SOCKET_PATH.exists():
+        return None
+
+    try:
+        with Client(str(SOCKET_PATH), family='AF_UNIX', authkey=authkey) as conn:
+            conn.send(message)
+            return conn.recv()
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+
+def transcribe_remote(files: List[str], include_timestamps: bool,
+                      settings: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Transcribe files with the running daemon.
+
+    Args:
+        files: Paths of the files to transcribe
+        include_timestamps: Whether to include timestamp information
+        settings: Model and other settings the caller wants; the daemon refuses a mismatch
+
+    Returns:
+        One result dictionary per file, or None if the daemon can't serve the request
+    """
+    reply = request({
+        'files': [str(Path(f).resolve()) for f in files],
+        'timestamps': include_timestamps,
+        'settings': settings,
+    })
+    if not reply or 'results' not in reply:
+        return None
+    return reply['results']
+
+
+def stop() -> bool:
+    """Ask the running daemon to shut down. Returns True if one was running."""
+    return request({'command': 'stop'}) is not None
@@ -38,11 +38,11 @@ python3 -m venv "$INSTALL_DIR"
 echo "📦 Installing dependencies..."
 source "$INSTALL_DIR/bin/activate"
 pip install --upgrade pip
-pip install openai-whisper
+pip install -r requirements.txt
 
 # Copy the transcribe script
 echo "📋 Installing transcription script..."
-cp transcribe.py "$INSTALL_DIR/"
+cp transcribe.py daemon.py "$INSTALL_DIR/"
 chmod +x "$INSTALL_DIR/transcribe.py"
 
 # Set up shell alias
@@ -5,22 +5,27 @@ A command-line tool for converting MP3 audio files to text transcripts using Ope
 """
 
 import argparse
+import hashlib
+import json
+import mmap
 import sys
 import os
 import shutil
-import time
+import stat
+import subprocess
 import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterable, Iterator, List, Optional, Dict, Any, Tuple
 
+import numpy as np
 import whisper
 import torch
-try:
-    from mutagen import File as MutagenFile
-    MUTAGEN_AVAILABLE = True
-except ImportError:
-    MUTAGEN_AVAILABLE = False
+from tqdm import tqdm
 
 try:
     from faster_whisper import WhisperModel
@@ -28,39 +33,104 @@ try:
 except ImportError:
     FASTER_WHISPER_AVAILABLE = False
 
+if FASTER_WHISPER_AVAILABLE:
+    # Installed but predating the batched pipeline: say so instead of quietly switching engines
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        sys.exit("Error: faster-whisper 1.1.0 or newer is required "
+                 "(pip install --upgrade 'faster-whisper>=1.1.0')")
+    from faster_whisper.vad import SpeechTimestampsMap, get_speech_timestamps
+
+import daemon
+
+# Silero VAD settings: pauses shorter than this stay inside a speech chunk
+VAD_PARAMETERS = {'min_silence_duration_ms': 500}
+
+# Models published only as CTranslate2 conversions, which original Whisper can't load
+FASTER_ONLY_MODELS = ('distil-large-v3',)
+
+# whisper.transcribe's defaults for judging a decode: no speech, or a degenerate result that
+# needs its temperature fallback
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+
+
+# Every MM:SS string under an hour, built once and indexed by whole seconds
+_TS_CACHE = [f"{m:02d}:{s:02d}" for m in range(60) for s in range(60)]
 
-class ProgressSpinner:
-    """Simple progress spinner for long-running operations."""
-    
-    def __init__(self, message: str = "Processing"):
-        self.message = message
-        self.spinner_chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-        self.running = False
-        self.thread = None
-    
-    def start(self):
-        """Start the spinner in a separate thread."""
-        self.running = True
-        self.thread = threading.Thread(target=self._spin)
-        self.thread.daemon = True
-        self.thread.start()
-    
-    def stop(self):
-        """Stop the spinner."""
-        self.running = False
-        if self.thread:
-            self.thread.join()
-        # Clear the spinner line
-        print("\r" + " " * (len(self.message) + 10) + "\r", end="", flush=True)
-    
-    def _spin(self):
-        """Internal method to animate the spinner."""
-        i = 0
-        while self.running:
-            char = self.spinner_chars[i % len(self.spinner_chars)]
-            print(f"\r   {char} {self.message}...", end="", flush=True)
-            time.sleep(0.1)
-            i += 1
+
+def _format_ts(seconds: float) -> str:
+    """Format a timestamp as MM:SS (minutes keep counting past the hour)."""
+    whole_seconds = int(seconds)
+    if whole_seconds < 3600:
+        return _TS_CACHE[whole_seconds]
+    minutes, secs = divmod(whole_seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def _write_bytes(path: Path, data: bytes):
+    """Write a whole file straight to the fd, skipping the TextIOWrapper/BufferedWriter stack."""
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Decoded-sample buffers, bucketed by power-of-two length and reused across files so batch
+# runs don't allocate a fresh multi-MB float32 array per file. Each process (CPU pool workers
+# included) keeps its own pool.
+_F32_POOL: Dict[int, List[np.ndarray]] = {}
+_F32_POOL_MAX_BYTES = 256 << 20
+_f32_pool_bytes = 0
+_f32_pool_lock = threading.Lock()
+# Buffers handed out, by data address; weak so a buffer that's never released is simply freed
+# (guarded by _f32_pool_lock along with the free lists: decoder threads acquire, the main thread releases)
+_f32_in_use: 'weakref.WeakValueDictionary[int, np.ndarray]' = weakref.WeakValueDictionary()
+
+
+def _acquire_f32(n: int) -> np.ndarray:
+    """A float32 array of length n, backed by a pooled buffer when one is free."""
+    global _f32_pool_bytes
+    bucket = 1 << max(n - 1, 0).bit_length()
+    with _f32_pool_lock:
+        free = _F32_POOL.get(bucket)
+        buf = free.pop() if free else None
+        if buf is not None:
+            _f32_pool_bytes -= buf.nbytes
+    if buf is None:
+        buf = np.empty(bucket, dtype=np.float32)
+    with _f32_pool_lock:
+        _f32_in_use[buf.ctypes.data] = buf
+    return buf[:n]
+
+
+def _release_f32(address: int):
+    """Return the buffer starting at address to the pool; unknown addresses are ignored."""
+    global _f32_pool_bytes
+    with _f32_pool_lock:
+        buf = _f32_in_use.pop(address, None)
+        if buf is None:
+            return
+        if _f32_pool_bytes + buf.nbytes <= _F32_POOL_MAX_BYTES:
+            _F32_POOL.setdefault(buf.size, []).append(buf)
+            _f32_pool_bytes += buf.nbytes
+
+
+def _output_settings(model_name: str, engine: str, device: Optional[str], vad_filter: bool,
+                     beam_size: Optional[int]) -> Dict[str, Any]:
+    """Settings that change a transcript's text: the daemon must match them, cache keys include them."""
+    device_type, compute_type = AudioTranscriber._precision(engine, device)
+    return {'model': model_name, 'engine': engine, 'device': device_type, 'compute_type': compute_type,
+            'vad': vad_filter, 'beam_size': beam_size}
+
+
+# __slots__-backed dataclasses where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class TranscriptionError(Exception):
@@ -78,7 +148,7 @@ class FileOutputError(TranscriptionError):
     pass
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TranscriptionResult:
     """Represents the result of a transcription operation."""
     text: str
@@ -86,9 +156,11 @@ class TranscriptionResult:
     language: str
     input_file: Path
     output_file: Path
+    input_name: str = ''  # input_file.name, kept so save loops skip the Path property
+    saved: bool = False  # Already streamed to output_file while transcribing
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TranscriptionConfig:
     """Configuration settings for transcription operations."""
     model_name: str = 'base'
@@ -98,12 +170,25 @@ class TranscriptionConfig:
     custom_output: Optional[str] = None
     device: Optional[str] = None  # Auto-detect best device
     engine: str = 'auto'  # 'auto', 'original', 'faster'
+    batch_size: int = 8  # Short clips decoded together (original) or 30s chunks per pass (faster)
+    compile: bool = False  # torch.compile the encoder (original engine, CUDA)
+    vad_filter: bool = True  # Drop non-speech with Silero VAD before the encoder runs
+    beam_size: Optional[int] = None  # None: engine default (greedy for original, 5 for faster)
+    workers: int = 1  # CPU processes sharing the cores, each with its own model
+    use_cache: bool = True  # Reuse transcripts of identical audio from ~/.cache/transcribe
 
 
 class FileManager:
     """Handles file validation and output path generation."""
     
-    SUPPORTED_EXTENSIONS = {'.mp3'}
+    SUPPORTED_EXTENSIONS = ('.mp3',)
+    
+    FFPROBE_ARGS = ['ffprobe', '-v', 'quiet', '-print_format', 'json',
+                    '-show_format', '-show_streams', '-select_streams', 'a:0']
+    
+    def __init__(self):
+        self.file_sizes: Dict[Path, int] = {}  # Filled by validate_input_files from its stat() calls
+        self._audio_info: Dict[Path, Dict[str, Any]] = {}
     
     def get_audio_info(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -115,49 +200,81 @@ class FileManager:
         Returns:
             Dictionary with audio information
         """
+        return self.get_audio_info_batch([file_path])[file_path]
+    
+    def get_audio_info_batch(self, file_paths: List[Path]) -> Dict[Path, Dict[str, Any]]:
+        """
+        Get audio information for several files, probing the ones not seen before in parallel.
+        
+        ffprobe only reads each file's headers; results are cached for later lookups.
+        
+        Args:
+            file_paths: Paths to audio files
+            
+        Returns:
+            Dictionary mapping each path to its audio information
+        """
+        missing = [path for path in dict.fromkeys(file_paths) if path not in self._audio_info]
+        if len(missing) == 1:
+            self._audio_info[missing[0]] = self._probe(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+                for path, info in zip(missing, pool.map(self._probe, missing)):
+                    self._audio_info[path] = info
+        
+        return {path: self._audio_info[path] for path in file_paths}
+    
+    def _probe(self, file_path: Path) -> Dict[str, Any]:
+        """Audio information for one file from a single ffprobe call."""
+        size = self.file_sizes.get(file_path)
+        if size is None:
+            size = file_path.stat().st_size
+        
         info = {
-            'size_mb': file_path.stat().st_size / (1024 * 1024),
+            'size_mb': size / (1024 * 1024),
             'duration_seconds': None,
             'duration_formatted': None,
             'bitrate': None,
             'sample_rate': None
         }
         
-        if MUTAGEN_AVAILABLE:
-            try:
-                audio_file = MutagenFile(file_path)
-                if audio_file and hasattr(audio_file, 'info'):
-                    if hasattr(audio_file.info, 'length'):
-                        info['duration_seconds'] = audio_file.info.length
-                        info['duration_formatted'] = self._format_duration(audio_file.info.length)
-                    if hasattr(audio_file.info, 'bitrate'):
-                        info['bitrate'] = audio_file.info.bitrate
-                    if hasattr(audio_file.info, 'sample_rate'):
-                        info['sample_rate'] = audio_file.info.sample_rate
-            except Exception:
-                # If we can't read metadata, continue without it
-                pass
+        try:
+            output = subprocess.run(
+                self.FFPROBE_ARGS + [os.fspath(file_path)],
+                capture_output=True, check=True
+            ).stdout
+            probe = json.loads(output)
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            # If we can't read metadata, continue without it
+            return info
+        
+        fmt = probe.get('format', {})
+        streams = probe.get('streams') or [{}]
+        if fmt.get('duration'):
+            info['duration_seconds'] = float(fmt['duration'])
+            info['duration_formatted'] = self._format_duration(info['duration_seconds'])
+        if fmt.get('bit_rate'):
+            info['bitrate'] = int(fmt['bit_rate']) // 1000  # kbps
+        if streams[0].get('sample_rate'):
+            info['sample_rate'] = int(streams[0]['sample_rate'])
         
         return info
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in MM:SS or HH:MM:SS format."""
-        if seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes:02d}:{secs:02d}"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        hours, rest = divmod(int(seconds), 3600)
+        if hours:
+            return f"{hours:02d}:{_TS_CACHE[rest]}"
+        return _TS_CACHE[rest]
     
     def validate_input_files(self, file_paths: List[str]) -> List[Path]:
         """
         Validates input files exist, are readable, and have correct format.
         
+        Directories are expanded to the MP3 files directly inside them.
+        
         Args:
-            file_paths: List of file path strings
+            file_paths: List of file or directory path strings
             
         Returns:
             List of validated Path objects
@@ -169,31 +286,51 @@ class FileManager:
         validated_files = []
         
         for file_path in file_paths:
-            path = Path(file_path)
+            # Cheap string test first: no syscalls or Path objects for rejected names
+            if not file_path.lower().endswith(self.SUPPORTED_EXTENSIONS):
+                try:
+                    is_dir = stat.S_ISDIR(os.stat(file_path).st_mode)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"File not found: {file_path}")
+                if is_dir:
+                    validated_files.extend(self._scan_directory(file_path))
+                    continue
+                raise ValueError(
+                    f"Unsupported file format: {Path(file_path).suffix}. "
+                    f"Supported formats: {', '.join(self.SUPPORTED_EXTENSIONS)}"
+                )
             
-            # Check if file exists
-            if not path.exists():
+            # One stat() answers existence, type and permissions
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"File not found: {file_path}")
             
             # Check if it's a file (not directory)
-            if not path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 raise ValueError(f"Path is not a file: {file_path}")
             
-            # Check file extension
-            if path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
-                raise ValueError(
-                    f"Unsupported file format: {path.suffix}. "
-                    f"Supported formats: {', '.join(self.SUPPORTED_EXTENSIONS)}"
-                )
-            
             # Check if file is readable
-            if not os.access(path, os.R_OK):
+            if not st.st_mode & 0o444:
                 raise ValueError(f"File is not readable: {file_path}")
             
+            path = Path(file_path)
+            self.file_sizes[path] = st.st_size
             validated_files.append(path)
         
         return validated_files
     
+    def _scan_directory(self, directory: str) -> List[Path]:
+        """MP3 files directly inside a directory, in name order."""
+        found = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(self.SUPPORTED_EXTENSIONS) and entry.is_file(follow_symlinks=False):
+                    path = Path(entry.path)
+                    self.file_sizes[path] = entry.stat(follow_symlinks=False).st_size
+                    found.append(path)
+        return sorted(found)
+    
     def generate_output_path(self, input_path: Path, custom_output: Optional[str] = None, 
                            model_name: Optional[str] = None, include_timestamps: bool = False) -> Path:
         """
@@ -251,10 +388,68 @@ class FileManager:
             return [self.generate_output_path(path, model_name=model_name, include_timestamps=include_timestamps) for path in input_paths]
 
 
+class TranscriptionCache:
+    """Transcripts stored on disk, keyed by the audio's content and the settings that shape the text."""
+    
+    def __init__(self, config: TranscriptionConfig, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            config: Transcription settings; the ones affecting output become part of every key
+            cache_dir: Where entries live (default: $XDG_CACHE_HOME/transcribe)
+        """
+        self.cache_dir = cache_dir or Path(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))) / "transcribe"
+        settings = _output_settings(config.model_name, config.engine, config.device,
+                                    config.vad_filter, config.beam_size)
+        settings['timestamps'] = config.include_timestamps
+        self._settings = json.dumps(settings, sort_keys=True).encode('utf-8')
+    
+    def key(self, file_path: Path) -> str:
+        """Cache key for a file: BLAKE2b over its bytes (memory-mapped) and the output settings."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    digest.update(data)
+        digest.update(self._settings)
+        return digest.hexdigest()
+    
+    def keys(self, file_paths: List[Path]) -> Dict[Path, str]:
+        """Cache keys for several files, hashed in parallel (hashlib releases the GIL)."""
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths) or 1)) as pool:
+            return dict(zip(file_paths, pool.map(self.key, file_paths)))
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored entry ('text', 'segments', 'language') for a key, or None on a miss."""
+        try:
+            with open(self.cache_dir / f"{key}.json", 'rb') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def put(self, key: str, result: TranscriptionResult):
+        """Store a result atomically, so a concurrent reader never sees a partial entry."""
+        entry = {'text': result.text, 'segments': result.segments, 'language': result.language}
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_bytes(tmp_path, json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # Caching is best effort; the transcript itself is still saved
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
 class AudioTranscriber:
     """Handles audio transcription using OpenAI's Whisper model with GPU acceleration."""
     
-    def __init__(self, model_name: str = 'base', device: Optional[str] = None, engine: str = 'auto'):
+    def __init__(self, model_name: str = 'base', device: Optional[str] = None, engine: str = 'auto',
+                 compile: bool = False, batch_size: int = 8, vad_filter: bool = True,
+                 beam_size: Optional[int] = None, file_manager: Optional[FileManager] = None,
+                 cpu_threads: Optional[int] = None):
         """
         Initialize the transcriber with a Whisper model.
         
@@ -262,17 +457,46 @@ class AudioTranscriber:
             model_name: Name of the Whisper model to use
             device: Device to use ('mps', 'cuda', 'cpu', or None for auto-detect)
             engine: Engine to use ('auto', 'original', 'faster')
+            compile: Compile the encoder with torch.compile (original engine on CUDA only)
+            batch_size: 30s chunks encoded per forward pass by faster-whisper's batched pipeline
+            vad_filter: Skip non-speech audio with Silero VAD (bundled with faster-whisper)
+            beam_size: Beam width for decoding (None for the engine's default, 1 for greedy)
+            file_manager: Shared FileManager, so audio info probed up front is reused
+            cpu_threads: Threads for faster-whisper on the CPU (default: all cores)
         """
         self.model_name = model_name
-        self.engine = self._choose_engine(engine)
+        self.compile = compile
+        self.batch_size = max(1, batch_size)
+        self.vad_filter = vad_filter
+        self.beam_size = beam_size
+        self.file_manager = file_manager or FileManager()
+        self.cpu_threads = cpu_threads or os.cpu_count() or 0
+        self.engine = self._choose_engine(engine, device)
         self.device = device or self._get_optimal_device()
+        
+        if self.device.startswith("cuda"):
+            # The encoder always sees a fixed 30s window: autotune convolutions once, allow TF32
+            torch.backends.cudnn.benchmark = True
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+            torch.set_float32_matmul_precision('high')
+        
         self.model = None
+        self.batched = None
+        self.fp16 = False
+        self._mel_window = None
+        self._mel_filters = None
         self._load_model()
     
-    def _choose_engine(self, engine: str) -> str:
+    @staticmethod
+    def _choose_engine(engine: str, device: Optional[str] = None) -> str:
         """Choose the best available engine."""
         if engine == 'auto':
-            # Prefer faster-whisper if available, especially for MPS compatibility
+            # CUDA: original Whisper in FP16 on tensor cores
+            if (device is None or device.startswith('cuda')) and torch.cuda.is_available():
+                return 'original'
+            # Elsewhere prefer int8 faster-whisper on CPU, especially for MPS compatibility
+            # (an explicit --engine faster on CUDA runs int8_float16 on the GPU)
             if FASTER_WHISPER_AVAILABLE:
                 return 'faster'
             else:
@@ -283,14 +507,12 @@ class AudioTranscriber:
         else:
             return engine
     
-    def _get_optimal_device(self) -> str:
+    @staticmethod
+    def _get_optimal_device() -> str:
         """Determine the best device for transcription on this system."""
         # CUDA is most stable for Whisper
         if torch.cuda.is_available():
             return "cuda"  # NVIDIA GPU
-        # For faster-whisper, we use CPU which works great
-        elif self.engine == 'faster':
-            return "cpu"  # Faster-whisper works well on CPU
         # MPS has some compatibility issues with original Whisper, but we'll try it with fallback
         elif torch.backends.mps.is_available() and torch.backends.mps.is_built():
             return "mps"  # Apple Silicon GPU (with CPU fallback if needed)
@@ -309,15 +531,42 @@ class AudioTranscriber:
     
     def _load_faster_whisper_model(self):
         """Load faster-whisper model."""
-        print(f"Loading Faster-Whisper model '{self.model_name}' on CPU...")
+        # CTranslate2 runs on CUDA or the CPU; there is no Metal backend, so MPS means CPU here
+        if not self.device.startswith("cuda"):
+            self.device = "cpu"
+        device, _, index = self.device.partition(":")
+        print(f"Loading Faster-Whisper model '{self.model_name}' on {device.upper()}...")
         
         # Check available disk space for model download
         self._check_disk_space()
         
-        # Faster-whisper uses CPU efficiently with different compute types
-        compute_type = "int8"  # Good balance of speed and accuracy
-        self.model = WhisperModel(self.model_name, device="cpu", compute_type=compute_type)
-        print(f"Model '{self.model_name}' loaded successfully with Faster-Whisper (CPU, {compute_type})")
+        compute_type = self._faster_compute_type(device)
+        self.model = WhisperModel(self.model_name, device=device, device_index=int(index or 0),
+                                  compute_type=compute_type, cpu_threads=self.cpu_threads)
+        # Batched pipeline: VAD splits each file into speech chunks that are encoded batch_size at a time
+        self.batched = BatchedInferencePipeline(model=self.model)
+        print(f"Model '{self.model_name}' loaded successfully with Faster-Whisper ({device.upper()}, {compute_type})")
+    
+    @staticmethod
+    def _precision(engine: str, device: Optional[str] = None) -> Tuple[str, str]:
+        """(device type, compute type) that _load_model picks for an engine on a requested device."""
+        device_type = (device or AudioTranscriber._get_optimal_device()).partition(":")[0]
+        if engine == 'faster':
+            device_type = "cuda" if device_type == "cuda" else "cpu"
+            return device_type, AudioTranscriber._faster_compute_type(device_type)
+        return device_type, "float16" if device_type == "cuda" else "float32"
+    
+    @staticmethod
+    def _faster_compute_type(device: str) -> str:
+        """Quantized compute type for a CTranslate2 device, falling back when the hardware lacks it."""
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+        # int8 weights halve the bytes streamed per forward pass; on GPU activations stay FP16
+        preferred = ("int8_float16", "float16") if device == "cuda" else ("int8", "float32")
+        for compute_type in preferred:
+            if compute_type in supported:
+                return compute_type
+        return "default"
     
     def _load_original_whisper_model(self):
         """Load original OpenAI Whisper model."""
@@ -334,21 +583,82 @@ class AudioTranscriber:
         # Check available disk space for model download
         self._check_disk_space()
         
+        # Load the checkpoint on the CPU and move it once, so the state dict isn't staged twice
+        self.model = whisper.load_model(self.model_name, device="cpu")
         try:
-            self.model = whisper.load_model(self.model_name, device=self.device)
+            self.model = self.model.to(self.device)
             print(f"Model '{self.model_name}' loaded successfully on {device_name}")
         except Exception as e:
             # Check if it's an MPS compatibility issue
             if self.device == "mps" and ("sparse" in str(e).lower() or "mps" in str(e).lower()):
                 print(f"Warning: MPS compatibility issue detected. Falling back to CPU...")
                 self.device = "cpu"
-                self.model = whisper.load_model(self.model_name, device=self.device)
+                self.model = self.model.to(self.device)
                 print(f"Model '{self.model_name}' loaded successfully on CPU (MPS fallback)")
             else:
                 raise e
+        
+        if self.device.startswith("cuda"):
+            torch.cuda.empty_cache()
+        
+        # Inference only: no autograd buffers even on paths without inference_mode()
+        self.model.eval()
+        for param in self.model.parameters():
+            param.requires_grad_(False)
+        
+        # Half-precision weights on CUDA; MPS still has flaky FP16 paths, so it stays FP32
+        self.fp16 = self.device.startswith("cuda")
+        if self.fp16:
+            self.model = self.model.half()
+        
+        if self.compile:
+            self._compile_encoder()
+    
+    def _compile_encoder(self):
+        """Capture the encoder's fixed 30s-window forward pass as a CUDA graph."""
+        if not self.device.startswith("cuda") or not hasattr(torch, "compile"):
+            print("Warning: --compile needs the original engine on CUDA with PyTorch 2.x; skipping")
+            return
+        
+        # Each batch size is its own graph; allow enough of them before falling back to eager
+        torch._dynamo.config.cache_size_limit = 64
+        self.model.encoder = torch.compile(self.model.encoder, mode="reduce-overhead", fullgraph=True)
+        
+        # Pay the compile cost now with a silent 30s window, the shape transcribe() feeds it
+        print("Compiling encoder with torch.compile (one-time warmup)...")
+        dtype = torch.float16 if self.fp16 else torch.float32
+        silence = torch.zeros(1, self.model.dims.n_mels, whisper.audio.N_FRAMES, device=self.device, dtype=dtype)
+        start_time = time.time()
+        with torch.inference_mode():
+            self.model.encoder(silence)
+        torch.cuda.synchronize(self.device)
+        print(f"Encoder compiled in {self._format_duration(time.time() - start_time)}")
+    
+    def _model_cached(self) -> bool:
+        """Whether the model weights are already on disk (no download needed)."""
+        if self.engine == 'faster':
+            try:
+                from faster_whisper.utils import download_model
+                download_model(self.model_name, local_files_only=True)
+                return True
+            except Exception:
+                return False
+        
+        url = whisper._MODELS.get(self.model_name)
+        if not url:
+            return False
+        cache_dir = Path(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))) / "whisper"
+        try:
+            st = os.stat(cache_dir / os.path.basename(url))
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and st.st_size > 0
     
     def _check_disk_space(self):
         """Check if there's sufficient disk space for model download."""
+        if self._model_cached():
+            return
+        
         try:
             # Get available disk space
             _, _, free_bytes = shutil.disk_usage(Path.home())
@@ -360,7 +670,10 @@ class AudioTranscriber:
                 'base': 0.2,    # ~74MB
                 'small': 0.5,   # ~244MB
                 'medium': 1.5,  # ~769MB
-                'large': 3.0    # ~1550MB
+                'large': 3.0,   # ~1550MB
+                'large-v3': 3.0,        # ~1550MB
+                'large-v3-turbo': 1.6,  # ~809MB (4 decoder layers instead of 32)
+                'distil-large-v3': 1.5  # ~756MB (faster-whisper only)
             }
             
             required_gb = model_sizes.get(self.model_name, 1.0)
@@ -371,11 +684,13 @@ class AudioTranscriber:
                     f"but only {free_gb:.1f}GB available. Please free up disk space."
                 )
                 
-        except Exception:
+        except OSError:
             # If we can't check disk space, continue anyway
-            pass  
+            pass
   
-    def transcribe_file(self, input_path: Path, include_timestamps: bool = False, verbose: bool = False) -> TranscriptionResult:
+    def transcribe_file(self, input_path: Path, include_timestamps: bool = False, verbose: bool = False,
+                        audio: Optional[torch.Tensor] = None,
+                        on_segment: Optional[Callable[[Path, Dict[str, Any]], None]] = None) -> TranscriptionResult:
         """
         Transcribe a single audio file.
         
@@ -383,6 +698,8 @@ class AudioTranscriber:
             input_path: Path to the input audio file
             include_timestamps: Whether to include timestamp information
             verbose: Whether to show detailed progress information
+            audio: Samples already decoded for input_path by decode_audio
+            on_segment: Called with (input_path, segment) for each segment as soon as it is decoded
             
         Returns:
             TranscriptionResult object containing transcription data
@@ -393,14 +710,13 @@ class AudioTranscriber:
         if not self.model:
             raise TranscriptionError("Model not loaded. Cannot perform transcription.")
         
+        input_name = input_path.name
+        
         try:
-            print(f"Transcribing: {input_path.name}")
+            print(f"Transcribing: {input_name}")
             
             # Get audio file information
-            # We need to access the file manager from the service, so let's pass it
-            # For now, let's create a temporary FileManager instance
-            temp_file_manager = FileManager()
-            audio_info = temp_file_manager.get_audio_info(input_path)
+            audio_info = self.file_manager.get_audio_info(input_path)
             
             # Always show basic info (size and duration if available)
             size_info = f"{audio_info['size_mb']:.1f} MB"
@@ -417,43 +733,74 @@ class AudioTranscriber:
             
             start_time = time.time()
             
-            # Show progress indicator during transcription
-            spinner = None
-            if not verbose:
-                spinner = ProgressSpinner("Transcribing")
-                spinner.start()
-            elif verbose:
+            # Progress is drawn from this thread as results arrive (a tqdm bar, unless verbose)
+            if verbose:
                 print("   Starting transcription...")
             
             # Perform transcription based on engine
             if self.engine == 'faster':
-                segments_iter, info = self.model.transcribe(str(input_path))
+                # faster-whisper takes the prefetched ndarray directly, or decodes the file itself
+                source = audio.numpy() if audio is not None else os.fspath(input_path)
+                if self.vad_filter:
+                    segments_iter, info = self.batched.transcribe(
+                        source, batch_size=self.batch_size, beam_size=self.beam_size or 5,
+                        vad_filter=True, vad_parameters=VAD_PARAMETERS
+                    )
+                else:
+                    # The batched pipeline needs VAD chunks for audio over 30s; decode sequentially instead
+                    segments_iter, info = self.model.transcribe(source, beam_size=self.beam_size or 5)
                 
                 # Convert faster-whisper format to original format
-                text = ""
+                texts = []
                 segments = []
-                for segment in segments_iter:
-                    text += segment.text
-                    if include_timestamps:
-                        segments.append({
-                            'start': segment.start,
-                            'end': segment.end,
-                            'text': segment.text
-                        })
+                with tqdm(total=round(info.duration, 1), unit='s', leave=False, disable=verbose,
+                          bar_format='   Transcribing {percentage:3.0f}% |{bar:20}| [{elapsed}]') as progress:
+                    for segment in segments_iter:
+                        texts.append(segment.text)
+                        if include_timestamps or on_segment:
+                            piece = {
+                                'start': segment.start,
+                                'end': segment.end,
+                                'text': segment.text
+                            }
+                            if include_timestamps:
+                                segments.append(piece)
+                            if on_segment:
+                                on_segment(input_path, piece)
+                        progress.update(min(segment.end, progress.total) - progress.n)
                 
                 language = info.language
-                text = text.strip()
+                text = ''.join(texts).strip()
             else:
-                # Original whisper
-                result = self.model.transcribe(str(input_path))
+                # Original whisper: hand over decoded samples so the mel is computed on-device
+                owned = None
+                if audio is None:
+                    audio = owned = self.decode_audio(input_path)
+                try:
+                    audio, speech_map = self._drop_silence(audio)
+                    with torch.inference_mode():
+                        # verbose=False makes whisper draw its own tqdm bar over mel frames
+                        result = self.model.transcribe(self._load_audio(input_path, audio), fp16=self.fp16,
+                                                       verbose=None if verbose else False,
+                                                       beam_size=self._whisper_beam_size())
+                finally:
+                    if owned is not None:
+                        self.release_audio(owned)
                 text = result['text'].strip()
-                segments = result.get('segments', []) if include_timestamps else []
+                segments = result.get('segments', []) if include_timestamps or on_segment else []
+                if speech_map:
+                    # Timestamps refer to the speech-only audio; map them back onto the file
+                    for segment in segments:
+                        segment['start'] = speech_map.get_original_time(segment['start'])
+                        segment['end'] = speech_map.get_original_time(segment['end'], is_end=True)
+                if on_segment:
+                    # whisper.transcribe returns all at once; hand the segments over in one go
+                    for segment in segments:
+                        on_segment(input_path, segment)
+                if not include_timestamps:
+                    segments = []
                 language = result.get('language', 'unknown')
             
-            # Stop spinner if it was running
-            if spinner:
-                spinner.stop()
-            
             end_time = time.time()
             duration = end_time - start_time
             
@@ -473,13 +820,217 @@ class AudioTranscriber:
                 segments=segments,
                 language=language,
                 input_file=input_path,
-                output_file=Path()  # Will be set by caller
+                output_file=Path(),  # Will be set by caller
+                input_name=input_name
             )
             
         except Exception as e:
-            raise TranscriptionError(f"Failed to transcribe {input_path.name}: {e}")
+            raise TranscriptionError(f"Failed to transcribe {input_name}: {e}")
     
-    def _format_duration(self, seconds: float) -> str:
+    def _whisper_beam_size(self) -> Optional[int]:
+        """Beam width in original Whisper's terms, where greedy decoding is spelled None."""
+        return self.beam_size if self.beam_size and self.beam_size > 1 else None
+    
+    def decode_audio(self, input_path: Path) -> torch.Tensor:
+        """
+        Decode a file to 16kHz samples on the CPU, pinned for async upload when using CUDA.
+        
+        Safe to call from worker threads, so decoding can run ahead of inference.
+        
+        Args:
+            input_path: Path to the input audio file
+            
+        Returns:
+            1-D float32 sample tensor; hand it to release_audio once the model is done with it
+        """
+        # Same ffmpeg call as whisper.load_audio, but the samples land in a pooled buffer
+        cmd = [
+            "ffmpeg", "-nostdin", "-threads", "0", "-i", str(input_path),
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le",
+            "-ar", str(whisper.audio.SAMPLE_RATE), "-"
+        ]
+        try:
+            out = subprocess.run(cmd, capture_output=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to load audio: {e.stderr.decode()}") from e
+        
+        pcm = np.frombuffer(out, np.int16)
+        samples = _acquire_f32(len(pcm))
+        np.multiply(pcm, np.float32(1 / 32768.0), out=samples, dtype=np.float32)
+        
+        audio = torch.from_numpy(samples)
+        if self.device.startswith("cuda"):
+            # The pinned copy is what gets uploaded; the pooled buffer is free again
+            audio = audio.pin_memory()
+            _release_f32(samples.ctypes.data)
+        return audio
+    
+    @staticmethod
+    def release_audio(audio: torch.Tensor):
+        """Give decode_audio's buffer back for reuse; audio must not be used afterwards."""
+        _release_f32(audio.data_ptr())
+    
+    def _load_audio(self, input_path: Path, audio: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """Decoded samples for a file (reusing prefetched ones), placed on the GPU when using CUDA."""
+        if audio is None:
+            audio = self.decode_audio(input_path)
+        if self.device.startswith("cuda"):
+            audio = audio.to(self.device, non_blocking=True)
+        return audio
+    
+    def _drop_silence(self, audio: torch.Tensor):
+        """
+        Cut non-speech out of CPU samples with Silero VAD, for the original engine.
+        
+        Args:
+            audio: 16kHz samples on the CPU
+            
+        Returns:
+            (speech-only samples, SpeechTimestampsMap), or the samples unchanged and None
+            when VAD is off or faster-whisper (which bundles the model) isn't installed
+        """
+        if not self.vad_filter or not FASTER_WHISPER_AVAILABLE:
+            return audio, None
+        
+        chunks = get_speech_timestamps(audio.numpy(), **VAD_PARAMETERS)
+        if not chunks:
+            return audio[:0], None
+        
+        speech = torch.cat([audio[chunk['start']:chunk['end']] for chunk in chunks])
+        if self.device.startswith("cuda"):
+            speech = speech.pin_memory()
+        return speech, SpeechTimestampsMap(chunks, whisper.audio.SAMPLE_RATE)
+    
+    def _log_mel_batch(self, audios: List[torch.Tensor]) -> torch.Tensor:
+        """
+        Log-mel spectrograms for clips of up to 30s, computed in one batched STFT on the model's device.
+        
+        Matches whisper.log_mel_spectrogram per clip, but reuses the Hann window and mel
+        filterbank instead of rebuilding and re-uploading them on every call.
+        
+        Args:
+            audios: 16kHz sample tensors, each at most 30 seconds long
+            
+        Returns:
+            Tensor of shape (B, n_mels, 3000)
+        """
+        if self._mel_window is None:
+            self._mel_window = torch.hann_window(whisper.audio.N_FFT, device=self.device)
+            self._mel_filters = whisper.audio.mel_filters(self.device, self.model.dims.n_mels)
+        
+        batch = torch.stack([whisper.pad_or_trim(audio) for audio in audios]).to(self.device)
+        stft = torch.stft(batch, whisper.audio.N_FFT, whisper.audio.HOP_LENGTH,
+                          window=self._mel_window, return_complex=True)
+        magnitudes = stft[..., :-1].abs() ** 2
+        
+        log_spec = torch.clamp(self._mel_filters @ magnitudes, min=1e-10).log10()
+        # Dynamic range is clamped per clip, as whisper does for a single spectrogram
+        log_spec = torch.maximum(log_spec, log_spec.amax(dim=(-2, -1), keepdim=True) - 8.0)
+        return (log_spec + 4.0) / 4.0
+    
+    def transcribe_batch(self, input_paths: List[Path], include_timestamps: bool = False,
+                         verbose: bool = False,
+                         audios: Optional[List[torch.Tensor]] = None,
+                         on_segment: Optional[Callable[[Path, Dict[str, Any]], None]] = None
+                         ) -> List[TranscriptionResult]:
+        """
+        Transcribe several files, decoding clips that fit in one 30s window in a single call.
+        
+        With the original engine, clips up to 30 seconds have their silence dropped and their
+        log-mel spectrograms stacked into one (B, n_mels, 3000) tensor, then decoded jointly.
+        Decodes that whisper.transcribe would judge as silence come back empty; ones it would
+        retry at a higher temperature go through transcribe_file. So do longer files, every
+        file when timestamps are wanted (a joint decode has no segment timings), and every file
+        with faster-whisper, which batches chunks within each file.
+        
+        Args:
+            input_paths: Paths to the input audio files
+            include_timestamps: Whether to include timestamp information
+            verbose: Whether to show detailed progress information
+            audios: Samples already decoded by decode_audio, in input order (None entries are decoded here)
+            on_segment: Called with (input_path, segment) for each segment as soon as it is decoded
+            
+        Returns:
+            TranscriptionResult objects in the same order as input_paths
+            
+        Raises:
+            TranscriptionError: If transcription of any file in the batch fails
+        """
+        audios = list(audios) if audios else [None] * len(input_paths)
+        
+        if self.engine != 'original' or len(input_paths) == 1 or include_timestamps:
+            return [
+                self.transcribe_file(path, include_timestamps, verbose, audio, on_segment)
+                for path, audio in zip(input_paths, audios)
+            ]
+        
+        try:
+            results: List[Optional[TranscriptionResult]] = [None] * len(input_paths)
+            short = []
+            clips = []
+            for i, path in enumerate(input_paths):
+                if audios[i] is None:
+                    audios[i] = self.decode_audio(path)
+                if len(audios[i]) > whisper.audio.N_SAMPLES:
+                    continue
+                
+                clip, _ = self._drop_silence(audios[i])
+                if len(clip):
+                    short.append(i)
+                    clips.append(self._load_audio(path, clip))
+                else:
+                    # VAD found no speech at all: nothing to decode
+                    results[i] = self._batch_result(path, '', 'unknown', 0.0, on_segment)
+            
+            if short:
+                print(f"Transcribing {len(short)} short file(s) in one batch")
+                start_time = time.time()
+                
+                with torch.inference_mode():
+                    mels = self._log_mel_batch(clips)
+                    options = whisper.DecodingOptions(fp16=self.fp16, beam_size=self._whisper_beam_size())
+                    decoded = whisper.decode(self.model, mels, options)
+                
+                for i, clip, decoding in zip(short, clips, decoded):
+                    # Same judgement whisper.transcribe makes on each window at temperature 0
+                    silent = (decoding.no_speech_prob > NO_SPEECH_THRESHOLD
+                              and decoding.avg_logprob < LOGPROB_THRESHOLD)
+                    if not silent and (decoding.compression_ratio > COMPRESSION_RATIO_THRESHOLD
+                                       or decoding.avg_logprob < LOGPROB_THRESHOLD):
+                        continue  # Left to transcribe_file, which retries at higher temperatures
+                    text = '' if silent else decoding.text.strip()
+                    duration = len(clip) / whisper.audio.SAMPLE_RATE
+                    results[i] = self._batch_result(input_paths[i], text, decoding.language, duration, on_segment)
+                
+                print(f"   Completed in {self._format_duration(time.time() - start_time)}")
+            
+        except Exception as e:
+            raise TranscriptionError(f"Failed to transcribe batch: {e}")
+        
+        for i, path in enumerate(input_paths):
+            if results[i] is None:
+                results[i] = self.transcribe_file(path, include_timestamps, verbose, audios[i], on_segment)
+        
+        return results
+    
+    @staticmethod
+    def _batch_result(input_path: Path, text: str, language: str, duration: float,
+                      on_segment: Optional[Callable[[Path, Dict[str, Any]], None]]) -> TranscriptionResult:
+        """Result for a clip decoded in a joint batch (plain text only, so no segments are kept)."""
+        if on_segment and text:
+            # A single 30s window carries no finer timing than the clip itself
+            on_segment(input_path, {'start': 0.0, 'end': duration, 'text': text})
+        return TranscriptionResult(
+            text=text,
+            segments=[],
+            language=language,
+            input_file=input_path,
+            output_file=Path(),  # Will be set by caller
+            input_name=input_path.name
+        )
+    
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
         """Format duration in a human-readable way."""
         if seconds < 60:
             return f"{seconds:.1f}s"
@@ -494,25 +1045,156 @@ class AudioTranscriber:
             return f"{hours}h {minutes}m {secs:.1f}s"
 
 
+def _gpu_worker(rank: int, shards: List[List[tuple]], config: TranscriptionConfig, queue):
+    """Multi-GPU worker: transcribe this rank's shard on cuda:<rank> and report (index, result, error)."""
+    shard = shards[rank]
+    try:
+        transcriber = AudioTranscriber(config.model_name, f"cuda:{rank}", 'original', config.compile,
+                                       config.batch_size, config.vad_filter, config.beam_size)
+    except Exception as e:
+        for index, _ in shard:
+            queue.put((index, None, str(e)))
+        return
+    
+    for index, input_path in shard:
+        try:
+            queue.put((index, transcriber.transcribe_file(input_path, config.include_timestamps), None))
+        except TranscriptionError as e:
+            queue.put((index, None, str(e)))
+
+
+# Per-process transcriber for CPU pool workers, loaded once by _init_cpu_worker
+_worker_transcriber: Optional[AudioTranscriber] = None
+_worker_config: Optional[TranscriptionConfig] = None
+_worker_error: Optional[str] = None
+
+
+def _init_cpu_worker(config: TranscriptionConfig, cpu_threads: int):
+    """CPU pool initializer: load this worker's model once, on its share of the cores."""
+    global _worker_transcriber, _worker_config, _worker_error
+    torch.set_num_threads(cpu_threads)
+    torch.set_grad_enabled(False)
+    _worker_config = config
+    try:
+        _worker_transcriber = AudioTranscriber(config.model_name, 'cpu', config.engine, False,
+                                               config.batch_size, config.vad_filter, config.beam_size,
+                                               cpu_threads=cpu_threads)
+    except Exception as e:
+        # Report the load failure per file rather than breaking the pool
+        _worker_error = str(e)
+
+
+def _cpu_worker_transcribe(input_path: Path):
+    """CPU pool task: transcribe one file and report (result, error)."""
+    if _worker_transcriber is None:
+        return None, _worker_error
+    try:
+        return _worker_transcriber.transcribe_file(input_path, _worker_config.include_timestamps), None
+    except TranscriptionError as e:
+        return None, str(e)
+
+
+class SegmentStreamer:
+    """Writes each file's transcript to its output file segment by segment, as it is decoded."""
+    
+    FLUSH_EVERY = 16  # Segments between flushes, so the file can be followed while it grows
+    
+    def __init__(self, output_path: Callable[[Path], Path], include_timestamps: bool):
+        """
+        Args:
+            output_path: Maps an input file to its output file
+            include_timestamps: Write '[MM:SS -> MM:SS] text' lines instead of running text
+        """
+        self.output_path = output_path
+        self.include_timestamps = include_timestamps
+        # input -> [file, segments seen, held-back whitespace, whether any text has been written]
+        self._open: Dict[Path, list] = {}
+    
+    def __call__(self, input_path: Path, segment: Dict[str, Any]):
+        """Append one segment to input_path's output file, opening it on the first segment."""
+        state = self._open.get(input_path)
+        if state is None:
+            state = self._open[input_path] = [open(self.output_path(input_path), 'w', encoding='utf-8'), 0, '', False]
+        f = state[0]
+        
+        if self.include_timestamps:
+            f.write(f"[{_format_ts(segment['start'])} -> {_format_ts(segment['end'])}] "
+                    f"{segment['text'].strip()}\n")
+        else:
+            # Same bytes as text.strip(): no leading space, trailing space held back until more text follows
+            piece = segment['text'] if state[3] else segment['text'].lstrip()
+            body = piece.rstrip()
+            if body:
+                f.write(state[2] + body)
+                state[2] = piece[len(body):]
+                state[3] = True
+            else:
+                state[2] += piece
+        
+        state[1] += 1
+        if state[1] % self.FLUSH_EVERY == 0:
+            f.flush()
+    
+    def finish(self, input_path: Path) -> bool:
+        """Complete input_path's output file. Returns False if nothing was streamed for it."""
+        f = self._open.pop(input_path, [None])[0]
+        if f is None:
+            return False
+        with f:
+            if not self.include_timestamps:
+                f.write('\n')  # Timestamp lines carry their own newlines
+        return True
+    
+    def abort(self, input_path: Path):
+        """Drop a partially written output file."""
+        state = self._open.pop(input_path, None)
+        if state is not None:
+            state[0].close()
+            os.unlink(state[0].name)
+    
+    def abort_all(self):
+        """Drop every output file that was not finished."""
+        for input_path in list(self._open):
+            self.abort(input_path)
+
+
 class TranscriptionService:
     """Main service class that orchestrates the transcription process."""
     
     def __init__(self, config: TranscriptionConfig, verbose: bool = False):
         """Initialize the transcription service with configuration."""
+        # Resolve 'auto' up front so cache keys and workers see the engine that actually runs
+        config.engine = AudioTranscriber._choose_engine(config.engine, config.device)
         self.config = config
         self.verbose = verbose
         self.file_manager = FileManager()
-        self.transcriber = AudioTranscriber(config.model_name, config.device, config.engine)
+        self.cache = TranscriptionCache(config) if config.use_cache else None
+        self._transcriber = None
     
-    def process_files(self, input_files: List[str]) -> List[TranscriptionResult]:
+    @property
+    def transcriber(self) -> AudioTranscriber:
+        """The local transcriber, loaded on first use (not at all if a daemon serves the job)."""
+        if self._transcriber is None:
+            self._transcriber = AudioTranscriber(
+                self.config.model_name, self.config.device, self.config.engine, self.config.compile,
+                self.config.batch_size, self.config.vad_filter, self.config.beam_size,
+                file_manager=self.file_manager
+            )
+        return self._transcriber
+    
+    def process_files(self, input_files: List[str]) -> Iterator[TranscriptionResult]:
         """
         Process multiple audio files for transcription.
         
+        Files are validated (and looked up in the cache) right away; transcription happens
+        as the returned iterator is consumed.
+        
         Args:
             input_files: List of input file paths
             
         Returns:
-            List of TranscriptionResult objects
+            Iterator of TranscriptionResult objects in input order, each yielded as soon as
+            it and every file before it are done
             
         Raises:
             Various exceptions for file validation and transcription errors
@@ -524,147 +1206,443 @@ class TranscriptionService:
         
         if self.verbose:
             print(f"\nProcessing {len(validated_files)} file(s) with {self.config.model_name} model")
-            total_size = sum(f.stat().st_size for f in validated_files) / (1024 * 1024)
+            total_size = sum(self.file_manager.file_sizes[f] for f in validated_files) / (1024 * 1024)
             print(f"Total size: {total_size:.1f} MB")
             print()
         
-        # Generate output paths
-        if self.config.batch_mode and self.config.custom_output:
-            output_paths = [Path(self.config.custom_output)]
-        else:
-            output_paths = [
-                self.file_manager.generate_output_path(
-                    path, 
-                    self.config.custom_output, 
-                    self.config.model_name,
-                    self.config.include_timestamps
+        # Reuse transcripts of audio already transcribed with the same settings
+        ready: Dict[int, Optional[TranscriptionResult]] = {}
+        keys = self.cache.keys(validated_files) if self.cache else {}
+        for index, input_path in enumerate(validated_files):
+            entry = self.cache.get(keys[input_path]) if self.cache else None
+            if entry is not None:
+                print(f"Using cached transcript: {input_path.name}")
+                ready[index] = TranscriptionResult(
+                    text=entry['text'],
+                    segments=entry['segments'],
+                    language=entry['language'],
+                    input_file=input_path,
+                    output_file=self._output_path(input_path),
+                    input_name=input_path.name
                 )
-                for path in validated_files
-            ]
         
-        results = []
+        return self._results_in_order(validated_files, ready, keys, overall_start_time)
+    
+    def _results_in_order(self, validated_files: List[Path], ready: Dict[int, Optional[TranscriptionResult]],
+                          keys: Dict[Path, str], overall_start_time: float) -> Iterator[TranscriptionResult]:
+        """Transcribe the files not already in ready and yield every result in input order."""
+        pending = [index for index in range(len(validated_files)) if index not in ready]
+        next_index = 0
+        produced = 0
         
-        # Process each file
-        for i, input_path in enumerate(validated_files):
-            try:
-                if len(validated_files) > 1:
-                    print(f"\n[{i+1}/{len(validated_files)}]", end=" ")
+        def release(final: bool = False) -> List[TranscriptionResult]:
+            # Hold finished files back only until everything before them is done
+            nonlocal next_index
+            released = []
+            while next_index < len(validated_files) and (final or next_index in ready):
+                result = ready.pop(next_index, None)
+                next_index += 1
+                if result is not None:  # failed files in batch mode
+                    released.append(result)
+            return released
+        
+        # Cached files at the front go out before any transcription starts
+        for result in release():
+            produced += 1
+            yield result
+        
+        if pending:
+            for pending_index, result in self._transcribe([validated_files[index] for index in pending]):
+                if result is not None and self.cache:
+                    self.cache.put(keys[result.input_file], result)
+                ready[pending[pending_index]] = result
+                for result in release():
+                    produced += 1
+                    yield result
+        
+        for result in release(final=True):
+            produced += 1
+            yield result
+        
+        overall_end_time = time.time()
+        overall_duration = overall_end_time - overall_start_time
+        
+        if len(validated_files) > 1 or self.verbose:
+            print(f"\nTotal processing time: {AudioTranscriber._format_duration(overall_duration)}")
+            if produced:
+                avg_time = overall_duration / produced
+                print(f"Average time per file: {AudioTranscriber._format_duration(avg_time)}")
+    
+    def _transcribe(self, validated_files: List[Path]) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """
+        Transcribe files with the daemon if one serves this model, else locally.
+        
+        Yields (index into validated_files, result) pairs in completion order; the result is
+        None for a file that failed in batch mode (the error has already been reported).
+        """
+        # Hand the job to a warm daemon if one holds this model with the same settings
+        settings = _output_settings(self.config.model_name, self.config.engine, self.config.device,
+                                    self.config.vad_filter, self.config.beam_size)
+        remote = daemon.transcribe_remote(validated_files, self.config.include_timestamps, settings)
+        if remote is not None:
+            return self._collect_remote_results(remote, validated_files)
+        
+        if self._use_multi_gpu(len(validated_files)):
+            return self._process_multi_gpu(validated_files)
+        if self._use_cpu_pool(len(validated_files)):
+            return self._process_cpu_pool(validated_files)
+        return self._process_local(validated_files)
+    
+    def _process_local(self, validated_files: List[Path]) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """Transcribe files in this process on a single device."""
+        total_files = len(validated_files)
+        batch_size = max(1, self.config.batch_size)
+        
+        # Shortest first (file size as a duration proxy) so each group holds clips of similar length
+        order = sorted(range(total_files), key=lambda i: self.file_manager.file_sizes.get(validated_files[i], 0))
+        ordered_files = [validated_files[i] for i in order]
+        
+        # Process files in groups so short clips can share one decode call
+        groups = [ordered_files[i:i + batch_size] for i in range(0, total_files, batch_size)]
+        
+        # Probe every file's header up front, in parallel, instead of once per transcription
+        self.file_manager.get_audio_info_batch(ordered_files)
+        
+        # Derived output files are written while each file transcribes; a custom (-o) one at the end
+        streamer = None
+        if not self.config.custom_output:
+            streamer = SegmentStreamer(self._output_path, self.config.include_timestamps)
+        
+        try:
+            yield from self._transcribe_groups(groups, order, total_files, batch_size, streamer)
+        finally:
+            if streamer:
+                streamer.abort_all()
+    
+    def _transcribe_groups(self, groups: List[List[Path]], order: List[int], total_files: int,
+                           batch_size: int, streamer: Optional[SegmentStreamer]
+                           ) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """Transcribe the size-sorted groups, yielding (input index, result) pairs as each group finishes."""
+        # Producer/consumer: decoder threads (ffmpeg runs outside the GIL) fill the next group
+        # while the model works on the current one; only one group is ever held in memory ahead
+        with ThreadPoolExecutor(max_workers=4) as decoder:
+            def prefetch(group):
+                return [decoder.submit(self.transcriber.decode_audio, path) for path in group]
+            
+            pending = prefetch(groups[0]) if groups else []
+            
+            for group_index, group in enumerate(groups):
+                start = group_index * batch_size
                 
-                result = self.transcriber.transcribe_file(
-                    input_path, 
-                    self.config.include_timestamps,
-                    self.verbose
-                )
+                audios = []
+                for future in pending:
+                    try:
+                        audios.append(future.result())
+                    except Exception:
+                        audios.append(None)  # Decode again in the transcriber and report the error there
                 
-                # Set output path
-                if self.config.batch_mode and self.config.custom_output:
-                    result.output_file = output_paths[0]
-                else:
-                    result.output_file = output_paths[i]
+                if group_index + 1 < len(groups):
+                    pending = prefetch(groups[group_index + 1])
                 
-                results.append(result)
+                if total_files > 1:
+                    if len(group) == 1:
+                        print(f"\n[{start+1}/{total_files}]", end=" ")
+                    else:
+                        print(f"\n[{start+1}-{start+len(group)}/{total_files}]", end=" ")
+                
+                try:
+                    group_results = self._transcribe_group(group, audios, streamer)
+                finally:
+                    # The group's decoded samples go back to the pool for the groups after it
+                    for audio in audios:
+                        if audio is not None:
+                            self.transcriber.release_audio(audio)
+                
+                if group_results is None:
+                    yield order[start], None
+                    continue
                 
-            except TranscriptionError as e:
+                for offset, result in enumerate(group_results):
+                    if result is not None:
+                        result.output_file = self._output_path(group[offset])
+                        result.saved = bool(streamer) and streamer.finish(group[offset])
+                    yield order[start + offset], result
+    
+    def _transcribe_group(self, group: List[Path], audios: List[Optional[torch.Tensor]],
+                          streamer: Optional[SegmentStreamer]) -> Optional[List[Optional[TranscriptionResult]]]:
+        """Transcribe one group, file by file if the batch fails; None if a lone file failed in batch mode."""
+        try:
+            return self.transcriber.transcribe_batch(
+                group,
+                self.config.include_timestamps,
+                self.verbose,
+                audios,
+                streamer
+            )
+        except TranscriptionError as e:
+            if streamer:
+                streamer.abort_all()
+            if len(group) == 1:
                 print(f"Error: {e}", file=sys.stderr)
+                if not self.config.batch_mode:
+                    raise
+                return None
+        
+        # Retry one file at a time so a single bad file doesn't sink the group
+        group_results = []
+        for offset, input_path in enumerate(group):
+            try:
+                group_results.append(self.transcriber.transcribe_file(
+                    input_path,
+                    self.config.include_timestamps,
+                    self.verbose,
+                    audios[offset] if audios else None,
+                    streamer
+                ))
+            except TranscriptionError as file_error:
+                if streamer:
+                    streamer.abort(input_path)
+                print(f"Error: {file_error}", file=sys.stderr)
                 if not self.config.batch_mode:
                     raise
                 # In batch mode, continue with other files
+                group_results.append(None)
+        return group_results
+    
+    def _output_path(self, input_path: Path) -> Path:
+        """Output file for one input: the shared file in batch mode, else derived from the input name."""
+        if self.config.batch_mode and self.config.custom_output:
+            return Path(self.config.custom_output)
+        return self.file_manager.generate_output_path(
+            input_path,
+            self.config.custom_output,
+            self.config.model_name,
+            self.config.include_timestamps
+        )
+    
+    def _use_multi_gpu(self, total_files: int) -> bool:
+        """Whether to shard files across several GPUs (original engine, CUDA, more than one file)."""
+        return (
+            total_files > 1
+            and torch.cuda.device_count() > 1
+            and self.config.engine != 'faster'
+            and (self.config.device is None or self.config.device == 'cuda')
+        )
+    
+    def _use_cpu_pool(self, total_files: int) -> bool:
+        """Whether to spread files over several CPU worker processes (--workers, CPU transcription only)."""
+        return (
+            self.config.workers > 1
+            and total_files > 1
+            and (self.config.device == 'cpu' or (self.config.device is None and not torch.cuda.is_available()))
+        )
+    
+    def _process_cpu_pool(self, validated_files: List[Path]) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """Transcribe files in worker processes that split the CPU cores, one model per worker."""
+        n_workers = min(self.config.workers, len(validated_files))
+        cpu_threads = max(1, (os.cpu_count() or 1) // n_workers)
+        print(f"Transcribing {len(validated_files)} file(s) in {n_workers} worker processes "
+              f"({cpu_threads} threads each)")
+        
+        # Longest first, so a long file doesn't start last and leave the other workers idle
+        ordered = sorted(range(len(validated_files)),
+                         key=lambda i: self.file_manager.file_sizes.get(validated_files[i], 0), reverse=True)
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=torch.multiprocessing.get_context('spawn'),
+            initializer=_init_cpu_worker,
+            initargs=(self.config, cpu_threads)
+        ) as pool:
+            futures = {pool.submit(_cpu_worker_transcribe, validated_files[i]): i for i in ordered}
+            
+            # Hand each file on as soon as its worker finishes
+            for future in as_completed(futures):
+                index = futures[future]
+                result, error = future.result()
+                if error is not None:
+                    print(f"Error: {error}", file=sys.stderr)
+                    if not self.config.batch_mode:
+                        pool.shutdown(cancel_futures=True)
+                        raise TranscriptionError(error)
+                    yield index, None
+                    continue
+                
+                result.output_file = self._output_path(validated_files[index])
+                yield index, result
+    
+    def _process_multi_gpu(self, validated_files: List[Path]) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """Shard files round-robin across all GPUs, one worker process and model replica per device."""
+        n_gpus = min(torch.cuda.device_count(), len(validated_files))
+        shards = [list(enumerate(validated_files))[rank::n_gpus] for rank in range(n_gpus)]
+        print(f"Sharding {len(validated_files)} file(s) across {n_gpus} GPUs")
+        
+        queue = torch.multiprocessing.get_context('spawn').SimpleQueue()
+        context = torch.multiprocessing.spawn(
+            _gpu_worker,
+            args=(shards, self.config, queue),
+            nprocs=n_gpus,
+            join=False
+        )
+        
+        # Drain the queue before joining so workers never block on a full pipe; results are
+        # handed on as they arrive, and a failure (outside batch mode) is raised once all are in
+        failure = None
+        outstanding = len(validated_files)
+        while outstanding:
+            if queue.empty():
+                # A worker that dies (CUDA OOM, segfault, a crash outside its per-file try) never
+                # posts the rest of its shard, so poll the processes instead of blocking on get()
+                try:
+                    exited = context.join(timeout=0.5)
+                except Exception as e:
+                    raise TranscriptionError(f"GPU worker failed: {e}")
+                if exited and queue.empty():
+                    raise TranscriptionError(f"GPU workers exited with {outstanding} file(s) unfinished")
                 continue
+            
+            index, result, error = queue.get()
+            outstanding -= 1
+            if failure is not None:
+                continue
+            if error is not None:
+                print(f"Error: {error}", file=sys.stderr)
+                if not self.config.batch_mode:
+                    failure = error
+                    continue
+                yield index, None
+                continue
+            
+            result.output_file = self._output_path(result.input_file)
+            yield index, result
         
-        overall_end_time = time.time()
-        overall_duration = overall_end_time - overall_start_time
+        while not context.join():
+            pass
         
-        if len(validated_files) > 1 or self.verbose:
-            print(f"\nTotal processing time: {self.transcriber._format_duration(overall_duration)}")
-            if results:
-                avg_time = overall_duration / len(results)
-                print(f"Average time per file: {self.transcriber._format_duration(avg_time)}")
+        if failure is not None:
+            raise TranscriptionError(failure)
+    
+    def _collect_remote_results(self, remote: List[Dict[str, Any]], input_paths: List[Path]
+                                ) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """Turn the daemon's per-file replies into TranscriptionResult objects."""
+        count = 0
         
-        return results
+        for index, (input_path, item) in enumerate(zip(input_paths, remote)):
+            if 'error' in item:
+                print(f"Error: {item['error']}", file=sys.stderr)
+                if not self.config.batch_mode:
+                    raise TranscriptionError(item['error'])
+                yield index, None
+                continue
+            
+            count += 1
+            yield index, TranscriptionResult(
+                text=item['text'],
+                segments=item['segments'],
+                language=item['language'],
+                input_file=input_path,
+                output_file=self._output_path(input_path),
+                input_name=input_path.name
+            )
+        
+        print(f"Transcribed {count} file(s) via daemon")
     
-    def save_results(self, results: List[TranscriptionResult]):
+    def save_results(self, results: Iterable[TranscriptionResult]) -> int:
         """
-        Save transcription results to output files.
+        Save transcription results to output files as they arrive.
         
         Args:
-            results: List of TranscriptionResult objects to save
+            results: TranscriptionResult objects to save, e.g. the iterator from process_files
+            
+        Returns:
+            Number of results saved
             
         Raises:
             FileOutputError: If file writing fails
         """
-        if not results:
-            print("No results to save.")
-            return
+        if self.config.batch_mode and self.config.custom_output:
+            # Concatenate all results into single file
+            return self._save_concatenated_results(results)
+        # Save each result to separate file
+        return self._save_individual_results(results)
+    
+    def _save_individual_results(self, results: Iterable[TranscriptionResult]) -> int:
+        """Save each result to its own output file, writing independent files in parallel."""
+        pending = deque()  # (output file, write or None if already streamed), in input order
+        latest: Dict[Path, Future] = {}  # Most recent write to each output file
+        saved = 0
+        
+        def report(wait: bool = False):
+            # Report finished writes in order as they complete, so a failure stops the run early
+            nonlocal saved
+            while pending and (wait or pending[0][1] is None or pending[0][1].done()):
+                output_file, write = pending.popleft()
+                if write is not None:
+                    write.result()
+                print(f"Saved: {output_file}")
+                saved += 1
+        
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            for result in results:
+                write = None
+                if not result.saved:
+                    previous = latest.get(result.output_file)
+                    if previous is not None:
+                        # Several inputs share this file (-o outside batch mode): let the earlier
+                        # write finish so the two can't interleave, and the last one wins
+                        previous.result()
+                    write = latest[result.output_file] = pool.submit(self._write_one, result)
+                pending.append((result.output_file, write))
+                report()
+            report(wait=True)
         
+        return saved
+    
+    def _write_one(self, result: TranscriptionResult):
+        """Render and write one result's output file."""
         try:
-            if self.config.batch_mode and self.config.custom_output:
-                # Concatenate all results into single file
-                self._save_concatenated_results(results)
-            else:
-                # Save each result to separate file
-                self._save_individual_results(results)
-                
+            _write_bytes(result.output_file, self._render(result).encode('utf-8'))
         except Exception as e:
-            raise FileOutputError(f"Failed to save results: {e}")
-    
-    def _save_individual_results(self, results: List[TranscriptionResult]):
-        """Save each result to its own output file."""
-        for result in results:
-            try:
-                with open(result.output_file, 'w', encoding='utf-8') as f:
-                    if self.config.include_timestamps and result.segments:
-                        # Write with timestamps
-                        for segment in result.segments:
-                            start_time = self._format_timestamp(segment['start'])
-                            end_time = self._format_timestamp(segment['end'])
-                            text = segment['text'].strip()
-                            f.write(f"[{start_time} -> {end_time}] {text}\n")
-                    else:
-                        # Write plain text
-                        f.write(result.text)
-                        f.write('\n')
-                
-                print(f"Saved: {result.output_file}")
-                
-            except Exception as e:
-                raise FileOutputError(f"Failed to save {result.output_file}: {e}")
+            raise FileOutputError(f"Failed to save {result.output_file}: {e}")
     
-    def _save_concatenated_results(self, results: List[TranscriptionResult]):
-        """Save all results concatenated into a single file."""
-        output_file = results[0].output_file
+    def _save_concatenated_results(self, results: Iterable[TranscriptionResult]) -> int:
+        """Save all results concatenated into a single file, appending each one as it arrives."""
+        output_file = Path(self.config.custom_output)
+        separator = ('\n' + '='*50 + '\n\n').encode('utf-8')
+        count = 0
+        f = None
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for i, result in enumerate(results):
-                    # Add file header
-                    f.write(f"=== {result.input_file.name} ===\n")
-                    
-                    if self.config.include_timestamps and result.segments:
-                        # Write with timestamps
-                        for segment in result.segments:
-                            start_time = self._format_timestamp(segment['start'])
-                            end_time = self._format_timestamp(segment['end'])
-                            text = segment['text'].strip()
-                            f.write(f"[{start_time} -> {end_time}] {text}\n")
+            for result in results:
+                # File header per result, separator between files (not after the last)
+                chunk = f"=== {result.input_name} ===\n{self._render(result)}".encode('utf-8')
+                try:
+                    if f is None:
+                        f = open(output_file, 'wb', buffering=1 << 20)
                     else:
-                        # Write plain text
-                        f.write(result.text)
-                        f.write('\n')
-                    
-                    # Add separator between files (except for last file)
-                    if i < len(results) - 1:
-                        f.write('\n' + '='*50 + '\n\n')
-            
+                        f.write(separator)
+                    f.write(chunk)
+                except Exception as e:
+                    raise FileOutputError(f"Failed to save concatenated results to {output_file}: {e}")
+                count += 1
+        finally:
+            if f is not None:
+                f.close()
+        
+        if count:
             print(f"Saved concatenated results: {output_file}")
-            
-        except Exception as e:
-            raise FileOutputError(f"Failed to save concatenated results to {output_file}: {e}")
+        return count
     
-    def _format_timestamp(self, seconds: float) -> str:
-        """Format timestamp in MM:SS format."""
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+    def _render(self, result: TranscriptionResult) -> str:
+        """Build one result's transcript body as a single string."""
+        if self.config.include_timestamps and result.segments:
+            # With timestamps
+            return ''.join(
+                f"[{_format_ts(segment['start'])} -> {_format_ts(segment['end'])}] "
+                f"{segment['text'].strip()}\n"
+                for segment in result.segments
+            )
+        # Plain text
+        return result.text + '\n'
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -674,7 +1652,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  %(prog)s audio.mp3                    # Basic transcription (uses faster-whisper)
+  %(prog)s audio.mp3                    # Basic transcription (faster-whisper on CPU, Whisper on CUDA)
   %(prog)s -m large audio.mp3           # Use large model for better accuracy
   %(prog)s --engine original audio.mp3  # Use original Whisper (may have MPS issues)
   %(prog)s --engine faster audio.mp3    # Use faster-whisper (better compatibility)
@@ -684,6 +1662,12 @@ Examples:
   %(prog)s *.mp3                        # Batch process multiple files
   %(prog)s -b -o all.txt *.mp3          # Concatenate all into single file
   %(prog)s -v audio.mp3                 # Verbose output
+  %(prog)s --daemon -m small &          # Keep the model loaded for later runs
+  %(prog)s --no-cache audio.mp3         # Ignore cached transcripts and transcribe again
+
+Transcripts are cached in $XDG_CACHE_HOME/transcribe (~/.cache/transcribe), keyed by the
+audio's content and every setting that changes the text (model, engine, device, precision,
+timestamps, VAD, beam size); a re-run on the same audio reuses them. Use --no-cache to bypass.
 
 Supported Models (accuracy vs speed):
   tiny   - Fastest, least accurate (~39MB)
@@ -691,6 +1675,9 @@ Supported Models (accuracy vs speed):
   small  - Better accuracy (~244MB)
   medium - High accuracy (~769MB)
   large  - Best accuracy (~1550MB)
+  large-v3        - Latest large model (~1550MB)
+  large-v3-turbo  - Near large-v3 accuracy, much faster (~809MB) (default with --engine faster)
+  distil-large-v3 - Distilled large-v3 (~756MB) (faster-whisper only)
 
 Device Options:
   auto   - Automatically select best device (default)
@@ -699,7 +1686,7 @@ Device Options:
   cpu    - CPU only
 
 Engine Options:
-  auto     - Prefer faster-whisper if available (default)
+  auto     - Original Whisper (FP16) on CUDA, otherwise int8 faster-whisper on CPU (default)
   original - Use OpenAI's original Whisper (may have MPS issues)
   faster   - Use faster-whisper (better compatibility, often faster)
         """
@@ -708,16 +1695,18 @@ Engine Options:
     # Positional arguments
     parser.add_argument(
         'files',
-        nargs='+',
-        help='MP3 audio file(s) to transcribe'
+        nargs='*',
+        help='MP3 audio file(s), or directories of them, to transcribe'
     )
     
     # Model selection
     parser.add_argument(
         '-m', '--model',
-        choices=['tiny', 'base', 'small', 'medium', 'large'],
-        default='base',
-        help='Whisper model to use (default: base)'
+        choices=['tiny', 'base', 'small', 'medium', 'large', 'large-v3', 'large-v3-turbo', 'distil-large-v3'],
+        default=None,
+        help='Whisper model to use; distil-large-v3 runs on faster-whisper only '
+             '(default: large-v3-turbo when --engine faster is given explicitly, otherwise base, '
+             'including with --engine auto)'
     )
     
     # Device selection
@@ -733,7 +1722,7 @@ Engine Options:
         '--engine',
         choices=['auto', 'original', 'faster'],
         default='auto',
-        help='Whisper engine to use: auto (prefer faster), original (OpenAI), faster (faster-whisper) (default: auto)'
+        help='Whisper engine to use: auto (original on CUDA, faster elsewhere), original (OpenAI), faster (faster-whisper) (default: auto)'
     )
     
     # Output options
@@ -754,6 +1743,50 @@ Engine Options:
         help='Batch mode: concatenate multiple files into single output'
     )
     
+    parser.add_argument(
+        '--compile',
+        action='store_true',
+        help='Compile the Whisper encoder with torch.compile (original engine on CUDA; adds a warmup at load)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=8,
+        help='Short (<=30s) clips decoded together by the original engine, or 30s chunks per '
+             'forward pass with faster-whisper (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--beam-size',
+        type=int,
+        default=None,
+        help='Beam width for decoding; 1 is greedy and about twice as fast '
+             '(default: greedy for original, 5 for faster-whisper)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Transcribe files in this many CPU processes, splitting the cores between them (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        dest='cache',
+        action='store_false',
+        help='Transcribe again even if this audio was already transcribed with the same settings '
+             '(transcripts are cached in $XDG_CACHE_HOME/transcribe, ~/.cache/transcribe by default)'
+    )
+    
+    parser.add_argument(
+        '--no-vad',
+        dest='vad_filter',
+        action='store_false',
+        help='Transcribe silence too instead of skipping it with Silero VAD'
+    )
+    
     # Utility options
     parser.add_argument(
         '-v', '--verbose',
@@ -761,6 +1794,27 @@ Engine Options:
         help='Show detailed info: file stats, bitrate, sample rate, language detection, character counts'
     )
     
+    # Daemon options
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Load the model once and serve later invocations over a Unix socket'
+    )
+    
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=600,
+        metavar='SECONDS',
+        help='Exit the daemon after this long without requests; 0 keeps it running (default: 600)'
+    )
+    
+    parser.add_argument(
+        '--stop-daemon',
+        action='store_true',
+        help='Stop a running daemon'
+    )
+    
     return parser
 
 
@@ -769,6 +1823,40 @@ def main():
     parser = create_argument_parser()
     args = parser.parse_args()
     
+    # Nothing here ever trains: no autograd bookkeeping outside the inference_mode() blocks either
+    torch.set_grad_enabled(False)
+    
+    if args.model is None:
+        # Turbo's pruned decoder makes large-v3 accuracy affordable under CTranslate2
+        args.model = 'large-v3-turbo' if args.engine == 'faster' else 'base'
+    
+    if args.model in FASTER_ONLY_MODELS:
+        if args.engine == 'original' or not FASTER_WHISPER_AVAILABLE:
+            parser.error(f"model '{args.model}' requires the faster-whisper engine")
+        # auto would pick original Whisper on CUDA, which can't load it
+        args.engine = 'faster'
+    
+    if args.stop_daemon:
+        print("Daemon stopped." if daemon.stop() else "No daemon running.")
+        return
+    
+    if args.daemon:
+        try:
+            transcriber = AudioTranscriber(
+                args.model, None if args.device == 'auto' else args.device, args.engine, args.compile,
+                args.batch_size, args.vad_filter, args.beam_size
+            )
+        except TranscriptionError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        settings = _output_settings(args.model, transcriber.engine, None if args.device == 'auto' else args.device,
+                                    transcriber.vad_filter, transcriber.beam_size)
+        daemon.serve(transcriber, settings, args.idle_timeout)
+        return
+    
+    if not args.files:
+        parser.error("the following arguments are required: files")
+    
     try:
         # Create configuration
         config = TranscriptionConfig(
@@ -777,7 +1865,13 @@ def main():
             batch_mode=args.batch,
             custom_output=args.output,
             device=None if args.device == 'auto' else args.device,
-            engine=args.engine
+            engine=args.engine,
+            batch_size=args.batch_size,
+            compile=args.compile,
+            vad_filter=args.vad_filter,
+            beam_size=args.beam_size,
+            workers=args.workers,
+            use_cache=args.cache
         )
         
         if args.verbose:
@@ -798,13 +1892,12 @@ def main():
             print("Error: Batch mode requires output filename (-o/--output)", file=sys.stderr)
             sys.exit(1)
         
-        # Create service and process files
+        # Create service; files are transcribed and saved one by one as results come in
         service = TranscriptionService(config, args.verbose)
-        results = service.process_files(args.files)
+        saved = service.save_results(service.process_files(args.files))
         
-        if results:
-            service.save_results(results)
-            print(f"\nSuccessfully processed {len(results)} file(s)")
+        if saved:
+            print(f"\nSuccessfully processed {saved} file(s)")
         else:
             print("No files were successfully processed.", file=sys.stderr)
             sys.exit(1)